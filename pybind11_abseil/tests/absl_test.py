@@ -18,55 +18,116 @@ import numpy as np
 
 from pybind11_abseil.tests import absl_example
 
+# Resolving a zone walks the zoneinfo database, so do it once per process.
+_LOCAL_TZ = tz.gettz()
+_UTC = tz.tzutc()
+_PACIFIC_TZ = tz.gettz('America/Los_Angeles')
+
+_check_civilday = absl_example.check_civilday
+_check_civilhour = absl_example.check_civilhour
+_check_civilminute = absl_example.check_civilminute
+_check_civilmonth = absl_example.check_civilmonth
+_check_civilsecond = absl_example.check_civilsecond
+_check_civilyear = absl_example.check_civilyear
+_check_datetime = absl_example.check_datetime
+_check_duration = absl_example.check_duration
+_check_map = absl_example.check_map
+_check_optional = absl_example.check_optional
+_check_set = absl_example.check_set
+_check_span = absl_example.check_span
+_check_span_no_copy = absl_example.check_span_no_copy
+_check_string_view = absl_example.check_string_view
+_fill_non_const_span_double = absl_example.fill_non_const_span_double
+_fill_non_const_span_int = absl_example.fill_non_const_span_int
+_make_civilday = absl_example.make_civilday
+_make_civilhour = absl_example.make_civilhour
+_make_civilminute = absl_example.make_civilminute
+_make_civilmonth = absl_example.make_civilmonth
+_make_civilsecond = absl_example.make_civilsecond
+_make_civilyear = absl_example.make_civilyear
+_make_datetime = absl_example.make_datetime
+_make_duration = absl_example.make_duration
+_make_map = absl_example.make_map
+_make_optional = absl_example.make_optional
+_make_set = absl_example.make_set
+
 
 if sys.version_info.major > 2:
   DateTime = datetime.datetime
 else:
   class DateTime(datetime.datetime):
+    _EPOCH = datetime.datetime(1970, 1, 1, tzinfo=_UTC)  # pylint: disable=g-tzinfo-datetime
 
     def timestamp(self):
       if self.tzinfo:
         with_tz = self
       else:
-        with_tz = self.replace(tzinfo=tz.gettz())  # pylint: disable=g-tzinfo-replace
-      epoch = datetime.datetime(1970, 1, 1, tzinfo=tz.tzutc())  # pylint: disable=g-tzinfo-datetime
-      return (with_tz - epoch).total_seconds()
+        with_tz = self.replace(tzinfo=_LOCAL_TZ)  # pylint: disable=g-tzinfo-replace
+      d = with_tz - self._EPOCH
+      return d.days * 86400 + d.seconds + d.microseconds * 1e-6
 
 
-class AbslTimeTest(parameterized.TestCase):
+class AbslTimeTest(absltest.TestCase):
   SECONDS_IN_DAY = 24 * 60 * 60
   POSITIVE_SECS = 3 * SECONDS_IN_DAY + 2.5
   NEGATIVE_SECS = -3 * SECONDS_IN_DAY + 2.5
   TEST_DATETIME = DateTime(2000, 1, 2, 3, 4, 5, int(5e5))
   # Linter error relevant for pytz only.
   # pylint: disable=g-tzinfo-replace
-  TEST_DATETIME_UTC = TEST_DATETIME.replace(tzinfo=tz.tzutc())
+  TEST_DATETIME_UTC = TEST_DATETIME.replace(tzinfo=_UTC)
   # pylint: enable=g-tzinfo-replace
+  # Timestamps of TEST_DATETIME_UTC truncated to each civil time granularity.
+  # We need to use a timezone aware datetime here, otherwise
+  # datetime.timestamp converts to localtime. UTC is chosen as the convention
+  # in the test cases.
+  TEST_TS_UTC = TEST_DATETIME_UTC.timestamp()
+  TEST_TS_CIVILSECOND = TEST_DATETIME_UTC.replace(microsecond=0).timestamp()
+  TEST_TS_CIVILMINUTE = TEST_DATETIME_UTC.replace(
+      second=0, microsecond=0).timestamp()
+  TEST_TS_CIVILHOUR = TEST_DATETIME_UTC.replace(
+      minute=0, second=0, microsecond=0).timestamp()
+  TEST_TS_CIVILDAY = TEST_DATETIME_UTC.replace(
+      hour=0, minute=0, second=0, microsecond=0).timestamp()
+  TEST_TS_CIVILMONTH = TEST_DATETIME_UTC.replace(
+      day=1, hour=0, minute=0, second=0, microsecond=0).timestamp()
+  TEST_TS_CIVILYEAR = TEST_DATETIME_UTC.replace(
+      month=1, day=1, hour=0, minute=0, second=0, microsecond=0).timestamp()
   TEST_DATE = datetime.date(2000, 1, 2)
+  _TEST_DATE_SECS = DateTime(TEST_DATE.year, TEST_DATE.month,
+                             TEST_DATE.day).timestamp()
+  # pylint: disable=g-tzinfo-datetime
+  # Warning about tzinfo applies to pytz, but we are using dateutil.tz
+  _DT_WITH_TZ = DateTime(year=2020, month=2, day=1, hour=20, tzinfo=_PACIFIC_TZ)
+  _DST_END_PT = DateTime(2020, 11, 1, 2, 0, 0, tzinfo=_PACIFIC_TZ)
+  # pylint: enable=g-tzinfo-datetime
+  _DT_WITH_TZ_SECS = _DT_WITH_TZ.timestamp()
+  _DST_END_SECS_PT = _DST_END_PT.timestamp()
+  _DST_END_NAIVE = DateTime(2020, 11, 1, 2, 0, 0)
+  _DST_END_SECS_NAIVE = _DST_END_NAIVE.timestamp()
+  _SECS_DST_FLIP = 1604224799  # 2020-11-01T02:00:00-08:00
 
   def test_return_positive_duration(self):
-    duration = absl_example.make_duration(self.POSITIVE_SECS)
+    duration = _make_duration(self.POSITIVE_SECS)
     self.assertEqual(duration.days, 3)
     self.assertEqual(duration.seconds, 2)
     self.assertEqual(duration.microseconds, 5e5)
 
   def test_return_negative_duration(self):
-    duration = absl_example.make_duration(self.NEGATIVE_SECS)
+    duration = _make_duration(self.NEGATIVE_SECS)
     self.assertEqual(duration.days, -3)
     self.assertEqual(duration.seconds, 2)
     self.assertEqual(duration.microseconds, 5e5)
 
   def test_pass_positive_duration(self):
     duration = datetime.timedelta(seconds=self.POSITIVE_SECS)
-    self.assertTrue(absl_example.check_duration(duration, self.POSITIVE_SECS))
+    self.assertTrue(_check_duration(duration, self.POSITIVE_SECS))
 
   def test_pass_negative_duration(self):
     duration = datetime.timedelta(seconds=self.NEGATIVE_SECS)
-    self.assertTrue(absl_example.check_duration(duration, self.NEGATIVE_SECS))
+    self.assertTrue(_check_duration(duration, self.NEGATIVE_SECS))
 
   def test_return_datetime(self):
     secs = self.TEST_DATETIME.timestamp()
-    local_tz = tz.gettz()
     # pylint: disable=g-tzinfo-datetime
     # Warning about tzinfo applies to pytz, but we are using dateutil.tz
     expected_datetime = DateTime(
@@ -77,141 +138,93 @@ class AbslTimeTest(parameterized.TestCase):
         minute=self.TEST_DATETIME.minute,
         second=self.TEST_DATETIME.second,
         microsecond=self.TEST_DATETIME.microsecond,
-        tzinfo=local_tz)
+        tzinfo=_LOCAL_TZ)
     # pylint: enable=g-tzinfo-datetime
     # datetime handling code will set the local timezone on C++ times for want
     # of a better alternative
-    self.assertEqual(expected_datetime, absl_example.make_datetime(secs))
+    self.assertEqual(expected_datetime, _make_datetime(secs))
 
   def test_pass_date(self):
-    secs = DateTime(
-        self.TEST_DATE.year,
-        self.TEST_DATE.month,
-        self.TEST_DATE.day).timestamp()
-    self.assertTrue(absl_example.check_datetime(self.TEST_DATE, secs))
+    self.assertTrue(_check_datetime(self.TEST_DATE, self._TEST_DATE_SECS))
 
   def test_pass_datetime(self):
     secs = self.TEST_DATETIME.timestamp()
-    self.assertTrue(absl_example.check_datetime(self.TEST_DATETIME, secs))
+    self.assertTrue(_check_datetime(self.TEST_DATETIME, secs))
 
   def test_pass_datetime_with_timezone(self):
-    pacific_tz = tz.gettz('America/Los_Angeles')
-    # pylint: disable=g-tzinfo-datetime
-    # Warning about tzinfo applies to pytz, but we are using dateutil.tz
-    dt_with_tz = DateTime(
-        year=2020, month=2, day=1, hour=20, tzinfo=pacific_tz)
-    # pylint: enable=g-tzinfo-datetime
-    secs = dt_with_tz.timestamp()
-    self.assertTrue(absl_example.check_datetime(dt_with_tz, secs))
+    self.assertTrue(_check_datetime(self._DT_WITH_TZ, self._DT_WITH_TZ_SECS))
 
   def test_pass_datetime_dst_with_timezone(self):
-    pacific_tz = tz.gettz('America/Los_Angeles')
-    # pylint: disable=g-tzinfo-datetime
-    dst_end = DateTime(2020, 11, 1, 2, 0, 0, tzinfo=pacific_tz)
-    # pylint: enable=g-tzinfo-datetime
-    secs = dst_end.timestamp()
-    self.assertTrue(absl_example.check_datetime(dst_end, secs))
+    self.assertTrue(_check_datetime(self._DST_END_PT, self._DST_END_SECS_PT))
 
   def test_pass_datetime_dst(self):
-    dst_end = DateTime(2020, 11, 1, 2, 0, 0)
-    secs = dst_end.timestamp()
-    self.assertTrue(absl_example.check_datetime(dst_end, secs))
-
-  @parameterized.named_parameters(('before', -1),
-                                  ('flip', 0),
-                                  ('after', 1))
-  def test_dst_datetime_from_timestamp(self, offs):
-    secs_flip = 1604224799  # 2020-11-01T02:00:00-08:00
-    secs = secs_flip + offs
-    time_utc = DateTime.fromtimestamp(secs, tz.tzutc())
-    time_local_aware = time_utc.astimezone(tz.gettz())
-    time_local_naive = time_local_aware.replace(tzinfo=None)
-    for time in (time_utc, time_local_aware, time_local_naive):
-      self.assertTrue(absl_example.check_datetime(time, secs))
+    self.assertTrue(_check_datetime(self._DST_END_NAIVE,
+                                    self._DST_END_SECS_NAIVE))
+
+  def test_dst_datetime_from_timestamp(self):
+    for offs in (-1, 0, 1):
+      with self.subTest(offs=offs):
+        secs = self._SECS_DST_FLIP + offs
+        time_utc = DateTime.fromtimestamp(secs, _UTC)
+        time_local_aware = time_utc.astimezone(_LOCAL_TZ)
+        time_local_naive = time_local_aware.replace(tzinfo=None)
+        for time in (time_utc, time_local_aware, time_local_naive):
+          self.assertTrue(_check_datetime(time, secs))
 
   def test_pass_datetime_pre_unix_epoch(self):
     dt = DateTime(1969, 7, 16, 10, 56, 7, microsecond=140)
     secs = dt.timestamp()
-    self.assertTrue(absl_example.check_datetime(dt, secs))
+    self.assertTrue(_check_datetime(dt, secs))
 
   def test_return_civilsecond(self):
-    # We need to use a timezone aware datetime here, otherwise
-    # datetime.timestamp converts to localtime. UTC is chosen as the convention
-    # in the test cases.
     truncated = self.TEST_DATETIME.replace(microsecond=0)
-    self.assertEqual(
-        truncated,
-        absl_example.make_civilsecond(self.TEST_DATETIME_UTC.timestamp()))
+    self.assertEqual(truncated, _make_civilsecond(self.TEST_TS_UTC))
 
   def test_pass_datetime_as_civilsecond(self):
-    truncated = self.TEST_DATETIME_UTC.replace(microsecond=0)
-    self.assertTrue(
-        absl_example.check_civilsecond(self.TEST_DATETIME,
-                                       truncated.timestamp()))
+    self.assertTrue(_check_civilsecond(self.TEST_DATETIME,
+                                       self.TEST_TS_CIVILSECOND))
 
   def test_return_civilminute(self):
     truncated = self.TEST_DATETIME.replace(second=0, microsecond=0)
-    self.assertEqual(
-        truncated,
-        absl_example.make_civilminute(self.TEST_DATETIME_UTC.timestamp()))
+    self.assertEqual(truncated, _make_civilminute(self.TEST_TS_UTC))
 
   def test_pass_datetime_as_civilminute(self):
-    truncated = self.TEST_DATETIME_UTC.replace(second=0, microsecond=0)
-    self.assertTrue(
-        absl_example.check_civilminute(self.TEST_DATETIME,
-                                       truncated.timestamp()))
+    self.assertTrue(_check_civilminute(self.TEST_DATETIME,
+                                       self.TEST_TS_CIVILMINUTE))
 
   def test_return_civilhour(self):
     truncated = self.TEST_DATETIME.replace(minute=0, second=0, microsecond=0)
-    self.assertEqual(
-        truncated,
-        absl_example.make_civilhour(self.TEST_DATETIME_UTC.timestamp()))
+    self.assertEqual(truncated, _make_civilhour(self.TEST_TS_UTC))
 
   def test_pass_datetime_as_civilhour(self):
-    truncated = self.TEST_DATETIME_UTC.replace(
-        minute=0, second=0, microsecond=0)
-    self.assertTrue(
-        absl_example.check_civilhour(self.TEST_DATETIME, truncated.timestamp()))
+    self.assertTrue(_check_civilhour(self.TEST_DATETIME,
+                                     self.TEST_TS_CIVILHOUR))
 
   def test_return_civilday(self):
     truncated = self.TEST_DATETIME.replace(
         hour=0, minute=0, second=0, microsecond=0)
-    self.assertEqual(
-        truncated,
-        absl_example.make_civilday(self.TEST_DATETIME_UTC.timestamp()))
+    self.assertEqual(truncated, _make_civilday(self.TEST_TS_UTC))
 
   def test_pass_datetime_as_civilday(self):
-    truncated = self.TEST_DATETIME_UTC.replace(
-        hour=0, minute=0, second=0, microsecond=0)
-    self.assertTrue(
-        absl_example.check_civilday(self.TEST_DATETIME, truncated.timestamp()))
+    self.assertTrue(_check_civilday(self.TEST_DATETIME, self.TEST_TS_CIVILDAY))
 
   def test_return_civilmonth(self):
     truncated = self.TEST_DATETIME.replace(
         day=1, hour=0, minute=0, second=0, microsecond=0)
-    self.assertEqual(
-        truncated,
-        absl_example.make_civilmonth(self.TEST_DATETIME_UTC.timestamp()))
+    self.assertEqual(truncated, _make_civilmonth(self.TEST_TS_UTC))
 
   def test_pass_datetime_as_civilmonth(self):
-    truncated = self.TEST_DATETIME_UTC.replace(
-        day=1, hour=0, minute=0, second=0, microsecond=0)
-    self.assertTrue(
-        absl_example.check_civilmonth(self.TEST_DATETIME,
-                                      truncated.timestamp()))
+    self.assertTrue(_check_civilmonth(self.TEST_DATETIME,
+                                      self.TEST_TS_CIVILMONTH))
 
   def test_return_civilyear(self):
     truncated = self.TEST_DATETIME.replace(
         month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-    self.assertEqual(
-        truncated,
-        absl_example.make_civilyear(self.TEST_DATETIME_UTC.timestamp()))
+    self.assertEqual(truncated, _make_civilyear(self.TEST_TS_UTC))
 
   def test_pass_datetime_as_civilyear(self):
-    truncated = self.TEST_DATETIME_UTC.replace(
-        month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-    self.assertTrue(
-        absl_example.check_civilyear(self.TEST_DATETIME, truncated.timestamp()))
+    self.assertTrue(_check_civilyear(self.TEST_DATETIME,
+                                     self.TEST_TS_CIVILYEAR))
 
 
 class AbslSpanTest(parameterized.TestCase):
@@ -226,88 +239,78 @@ class AbslSpanTest(parameterized.TestCase):
   def test_pass_span_from(self, values):
     # Pass values twice- one will be converted to a span, the other to a vector
     # (which is known to work), and then they will be compared.
-    self.assertTrue(absl_example.check_span(values, values))
+    self.assertTrue(_check_span(values, values))
 
   def test_span_with_pointers(self):
     objs = [absl_example.ObjectForSpan(3), absl_example.ObjectForSpan(5)]
     self.assertEqual(absl_example.SumObjectPointersSpan(objs), 8)
 
 
-class AbslNonConstSpanTest(parameterized.TestCase):
+class AbslNonConstSpanTest(absltest.TestCase):
   _VECTOR_SIZE = 5
   _CHECKED_VALUE_DOUBLE = 3.14
   _CHECKED_VALUE_INT = 43
 
-  @parameterized.named_parameters(
-      ('double', np.zeros(_VECTOR_SIZE, dtype=np.float),
-       'fill_non_const_span_double', _CHECKED_VALUE_DOUBLE),
-      ('int', np.zeros(_VECTOR_SIZE, dtype=np.int32),
-       'fill_non_const_span_int', _CHECKED_VALUE_INT))
-  def test_span_as_out_parameter(self, vector, function_name, value):
-    span_test_function = getattr(absl_example, function_name)
-    span_test_function(value, vector)
-    for e in vector:
-      self.assertEqual(e, value)
-
-  @parameterized.named_parameters(
-      ('double', np.zeros((_VECTOR_SIZE, _VECTOR_SIZE), dtype=np.float),
-       'fill_non_const_span_double', _CHECKED_VALUE_DOUBLE),
-      ('int', np.zeros(
-          (_VECTOR_SIZE, _VECTOR_SIZE),
-          dtype=np.int32), 'fill_non_const_span_int', _CHECKED_VALUE_INT))
-  def test_fails_for_wrong_numpy_dimensions(self, vector, function_name, value):
-    span_test_function = getattr(absl_example, function_name)
-    with self.assertRaises(TypeError):
-      span_test_function(value, vector)
-
-  @parameterized.named_parameters(
-      ('double', np.zeros(_VECTOR_SIZE, dtype=np.float),
-       'fill_non_const_span_double', _CHECKED_VALUE_DOUBLE),
-      ('int', np.zeros(_VECTOR_SIZE, dtype=np.int32),
-       'fill_non_const_span_int', _CHECKED_VALUE_INT))
-  def test_fails_for_non_writable_numpy_vector(self, vector, function_name,
-                                               value):
-    span_test_function = getattr(absl_example, function_name)
-    vector.flags.writeable = False
-    with self.assertRaises(TypeError):
-      span_test_function(value, vector)
-
-  @parameterized.named_parameters(
-      ('double', [0.0] * _VECTOR_SIZE, 'fill_non_const_span_double',
-       _CHECKED_VALUE_DOUBLE), ('int', [0] * _VECTOR_SIZE,
-                                'fill_non_const_span_int', _CHECKED_VALUE_INT))
-  def test_fails_for_non_numpy_vector(self, vector, function_name, value):
-    span_test_function = getattr(absl_example, function_name)
-    with self.assertRaises(TypeError):
-      span_test_function(value, vector)
-
-  @parameterized.named_parameters(
-      ('double', np.zeros(_VECTOR_SIZE, dtype=np.float),
-       'fill_non_const_span_double', _CHECKED_VALUE_DOUBLE),
-      ('int', np.zeros(_VECTOR_SIZE, dtype=np.int32),
-       'fill_non_const_span_int', _CHECKED_VALUE_INT))
-  def test_fails_for_non_contiguous_numpy_vector(self, vector, function_name,
-                                                 value):
-    span_test_function = getattr(absl_example, function_name)
-    # View with step > 1 is a way to get non-contiguous memory.
-    v_strided = vector[::2]
-    with self.assertRaises(TypeError):
-      span_test_function(value, v_strided)
+  # Arrays are built inside each case so that no case sees flags or contents
+  # left behind by another one.
+  _SPAN_CASES = (
+      ('double', np.float64, _fill_non_const_span_double,
+       _CHECKED_VALUE_DOUBLE),
+      ('int', np.int32, _fill_non_const_span_int, _CHECKED_VALUE_INT),
+  )
+
+  def test_span_as_out_parameter(self):
+    for name, dtype, span_test_function, value in self._SPAN_CASES:
+      with self.subTest(name=name):
+        vector = np.zeros(self._VECTOR_SIZE, dtype=dtype)
+        span_test_function(value, vector)
+        np.testing.assert_array_equal(vector, value)
+
+  def test_fails_for_wrong_numpy_dimensions(self):
+    for name, dtype, span_test_function, value in self._SPAN_CASES:
+      with self.subTest(name=name):
+        vector = np.zeros((self._VECTOR_SIZE, self._VECTOR_SIZE), dtype=dtype)
+        with self.assertRaises(TypeError):
+          span_test_function(value, vector)
+
+  def test_fails_for_non_writable_numpy_vector(self):
+    for name, dtype, span_test_function, value in self._SPAN_CASES:
+      with self.subTest(name=name):
+        vector = np.zeros(self._VECTOR_SIZE, dtype=dtype)
+        vector.flags.writeable = False
+        with self.assertRaises(TypeError):
+          span_test_function(value, vector)
+
+  def test_fails_for_non_numpy_vector(self):
+    for name, dtype, span_test_function, value in self._SPAN_CASES:
+      with self.subTest(name=name):
+        vector = [dtype(0).item()] * self._VECTOR_SIZE
+        with self.assertRaises(TypeError):
+          span_test_function(value, vector)
+
+  def test_fails_for_non_contiguous_numpy_vector(self):
+    for name, dtype, span_test_function, value in self._SPAN_CASES:
+      with self.subTest(name=name):
+        vector = np.zeros(self._VECTOR_SIZE, dtype=dtype)
+        # View with step > 1 is a way to get non-contiguous memory.
+        v_strided = vector[::2]
+        with self.assertRaises(TypeError):
+          span_test_function(value, v_strided)
 
   def test_fails_for_not_supported_type(self):
     # Checking only the floating version of the function as there is a type
     # mismatch in any case.
     vector = np.zeros(AbslNonConstSpanTest._VECTOR_SIZE, dtype=np.unicode_)
     with self.assertRaises(TypeError):
-      absl_example.fill_non_const_span_double(
-          AbslNonConstSpanTest._CHECKED_VALUE_DOUBLE, vector)
+      _fill_non_const_span_double(AbslNonConstSpanTest._CHECKED_VALUE_DOUBLE,
+                                  vector)
 
   def test_const_span_wrapper(self):
     # Test that we can use non-const Span as wrapper for const Span to avoid
     # copying data.
     values = [1, 2, 3, 4]
     vector = np.array(values, dtype=np.int32)
-    self.assertTrue(absl_example.check_span_no_copy(vector, values))
+    self.assertTrue(_check_span_no_copy(vector, values))
 
 
 class AbslStringViewTest(absltest.TestCase):
@@ -319,61 +322,64 @@ class AbslStringViewTest(absltest.TestCase):
         container.make_string_view(self.TEST_STRING), self.TEST_STRING)
 
   def test_pass_string_view(self):
-    self.assertTrue(
-        absl_example.check_string_view(self.TEST_STRING, self.TEST_STRING))
+    self.assertTrue(_check_string_view(self.TEST_STRING, self.TEST_STRING))
 
 
 class AbslFlatHashMapTest(absltest.TestCase):
+  _MAP_FIXTURE_KV = [(1, 2), (3, 4), (5, 6)]
+  _MAP_FIXTURE_DICT = dict(_MAP_FIXTURE_KV)
+  _PASS_MAP_KV = [(10, 20), (30, 40)]
+  _PASS_MAP_DICT = dict(_PASS_MAP_KV)
 
   def test_return_map(self):
-    keys_and_values = [(1, 2), (3, 4), (5, 6)]
-    expected = dict(keys_and_values)
-    self.assertEqual(expected, absl_example.make_map(keys_and_values))
+    self.assertEqual(self._MAP_FIXTURE_DICT, _make_map(self._MAP_FIXTURE_KV))
 
   def test_pass_map(self):
-    expected = [(10, 20), (30, 40)]
-    self.assertTrue(absl_example.check_map(dict(expected), expected))
+    self.assertTrue(_check_map(self._PASS_MAP_DICT, self._PASS_MAP_KV))
 
 
 class AbslFlatHashSetTest(absltest.TestCase):
+  _SET_FIXTURE_LIST = [1, 3, 7, 5]
+  _SET_FIXTURE_SET = set(_SET_FIXTURE_LIST)
+  _PASS_SET_LIST = [10, 20, 30, 40]
+  _PASS_SET = set(_PASS_SET_LIST)
 
   def test_return_set(self):
-    values = [1, 3, 7, 5]
-    expected = set(values)
-    self.assertEqual(expected, absl_example.make_set(values))
+    self.assertEqual(self._SET_FIXTURE_SET, _make_set(self._SET_FIXTURE_LIST))
 
   def test_pass_set(self):
-    expected = [10, 20, 30, 40]
-    self.assertTrue(absl_example.check_set(set(expected), expected))
+    self.assertTrue(_check_set(self._PASS_SET, self._PASS_SET_LIST))
 
 
 class AbslOptionalTest(absltest.TestCase):
 
   def test_pass_default_nullopt(self):
-    self.assertTrue(absl_example.check_optional())
+    self.assertTrue(_check_optional())
 
   def test_pass_value(self):
-    self.assertTrue(absl_example.check_optional(5, True, 5))
+    self.assertTrue(_check_optional(5, True, 5))
 
   def test_pass_none(self):
-    self.assertTrue(absl_example.check_optional(None, False))
+    self.assertTrue(_check_optional(None, False))
 
   def test_return_value(self):
-    self.assertEqual(absl_example.make_optional(5), 5)
+    self.assertEqual(_make_optional(5), 5)
 
   def test_return_none(self):
-    self.assertIsNone(absl_example.make_optional())
+    self.assertIsNone(_make_optional())
 
 
 class AbslVariantTest(absltest.TestCase):
 
   def test_variant(self):
-    assert absl_example.VariantToInt(absl_example.A(3)) == 3
-    assert absl_example.VariantToInt(absl_example.B(5)) == 5
+    objs = [absl_example.A(3), absl_example.B(5)]
+    assert absl_example.VariantToInt(objs[0]) == 3
+    assert absl_example.VariantToInt(objs[1]) == 5
 
+    # Neither function mutates its input, so the same objects can be passed to
+    # both: Identity must hand them back, IdentityWithCopy must not.
     for identity_f, should_be_equal in [(absl_example.Identity, True),
                                         (absl_example.IdentityWithCopy, False)]:
-      objs = [absl_example.A(3), absl_example.B(5)]
       vector = identity_f(objs)
       self.assertLen(vector, 2)
       self.assertIsInstance(vector[0], absl_example.A)
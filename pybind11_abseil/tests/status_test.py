@@ -8,92 +8,118 @@ from absl.testing import absltest
 from pybind11_abseil import status
 from pybind11_abseil.tests import status_example
 
+_OK = status.StatusCode.OK
+_CANCELLED = status.StatusCode.CANCELLED
+_ABORTED = status.StatusCode.ABORTED
+_NOT_FOUND = status.StatusCode.NOT_FOUND
+
+_check_status = status_example.check_status
+_make_failure_status_or = status_example.make_failure_status_or
+_make_failure_status_or_manual_cast = (
+    status_example.make_failure_status_or_manual_cast)
+_make_status = status_example.make_status
+_make_status_manual_cast = status_example.make_status_manual_cast
+_make_status_ptr = status_example.make_status_ptr
+_make_status_ref = status_example.make_status_ref
+_return_failure_status_or = status_example.return_failure_status_or
+_return_failure_status_or_pointer = (
+    status_example.return_failure_status_or_pointer)
+_return_ptr_status_or = status_example.return_ptr_status_or
+_return_status = status_example.return_status
+_return_status_or_pointer = status_example.return_status_or_pointer
+_return_unique_ptr_status_or = status_example.return_unique_ptr_status_or
+_return_value_status_or = status_example.return_value_status_or
+
 
 class StatusTest(absltest.TestCase):
 
+  @classmethod
+  def setUpClass(cls):
+    super(StatusTest, cls).setUpClass()
+    cls._test_obj = status_example.TestClass()
+
   def test_pass_status(self):
-    test_status = status.Status(status.StatusCode.CANCELLED, 'test')
-    self.assertTrue(
-        status_example.check_status(test_status, status.StatusCode.CANCELLED))
+    test_status = status.Status(_CANCELLED, 'test')
+    self.assertTrue(_check_status(test_status, _CANCELLED))
 
   def test_return_ok(self):
     # The return_status function should convert an ok status to None.
-    self.assertIsNone(status_example.return_status(status.StatusCode.OK))
+    self.assertIsNone(_return_status(_OK))
 
   def test_return_not_ok(self):
     # The return_status function should convert a non-ok status to an exception.
     with self.assertRaises(status.StatusNotOk) as cm:
-      status_example.return_status(status.StatusCode.CANCELLED, 'test')
-    self.assertEqual(cm.exception.status.code(), status.StatusCode.CANCELLED)
-    self.assertEqual(cm.exception.status.message(), 'test')
+      _return_status(_CANCELLED, 'test')
+    exc_status = cm.exception.status
+    self.assertEqual(exc_status.code(), _CANCELLED)
+    self.assertEqual(exc_status.message(), 'test')
 
   def test_return_not_ok_catch_with_alias(self):
     # Catch as status_example.StatusNotOk, an alias of status.StatusNotOk.
     with self.assertRaises(status_example.StatusNotOk) as cm:
-      status_example.return_status(status.StatusCode.CANCELLED, 'test')
-    self.assertEqual(cm.exception.status.code(), status.StatusCode.CANCELLED)
-    self.assertEqual(cm.exception.status.message(), 'test')
+      _return_status(_CANCELLED, 'test')
+    exc_status = cm.exception.status
+    self.assertEqual(exc_status.code(), _CANCELLED)
+    self.assertEqual(exc_status.message(), 'test')
 
   def test_return_not_ok_catch_as_generic_exception(self):
     # Catch as a generic Exception, the base type of StatusNotOk.
     with self.assertRaises(Exception):
-      status_example.return_status(status.StatusCode.CANCELLED, 'test')
+      _return_status(_CANCELLED, 'test')
 
   def test_make_ok(self):
     # The make_status function has been set up to return a status object
     # instead of raising an exception (this is done in status_example.cc).
-    test_status = status_example.make_status(status.StatusCode.OK)
-    self.assertEqual(test_status.code(), status.StatusCode.OK)
+    test_status = _make_status(_OK)
+    self.assertEqual(test_status.code(), _OK)
     self.assertTrue(test_status.ok())
 
   def test_make_not_ok(self):
     # The make_status function should always return a status object, even if
     # it is not ok (ie, it should *not* convert it to an exception).
-    test_status = status_example.make_status(status.StatusCode.CANCELLED)
-    self.assertEqual(test_status.code(), status.StatusCode.CANCELLED)
+    test_status = _make_status(_CANCELLED)
+    self.assertEqual(test_status.code(), _CANCELLED)
     self.assertFalse(test_status.ok())
 
   def test_make_not_ok_manual_cast(self):
-    test_status = status_example.make_status_manual_cast(
-        status.StatusCode.CANCELLED)
-    self.assertEqual(test_status.code(), status.StatusCode.CANCELLED)
+    test_status = _make_status_manual_cast(_CANCELLED)
+    self.assertEqual(test_status.code(), _CANCELLED)
 
   def test_make_status_ref(self):
-    result_1 = status_example.make_status_ref(status.StatusCode.OK)
-    self.assertEqual(result_1.code(), status.StatusCode.OK)
-    result_2 = status_example.make_status_ref(status.StatusCode.CANCELLED)
-    self.assertEqual(result_2.code(), status.StatusCode.CANCELLED)
+    result_1 = _make_status_ref(_OK)
+    self.assertEqual(result_1.code(), _OK)
+    result_2 = _make_status_ref(_CANCELLED)
+    self.assertEqual(result_2.code(), _CANCELLED)
     # result_1 and 2 reference the same value, so they should always be equal.
     self.assertEqual(result_1.code(), result_2.code())
 
   def test_make_status_ptr(self):
-    result_1 = status_example.make_status_ptr(status.StatusCode.OK)
-    self.assertEqual(result_1.code(), status.StatusCode.OK)
-    result_2 = status_example.make_status_ptr(status.StatusCode.CANCELLED)
-    self.assertEqual(result_2.code(), status.StatusCode.CANCELLED)
+    result_1 = _make_status_ptr(_OK)
+    self.assertEqual(result_1.code(), _OK)
+    result_2 = _make_status_ptr(_CANCELLED)
+    self.assertEqual(result_2.code(), _CANCELLED)
     # result_1 and 2 reference the same value, so they should always be equal.
     self.assertEqual(result_1.code(), result_2.code())
 
   def test_canonical_error(self):
     test_status = status.aborted_error('test')
-    self.assertEqual(test_status.code(), status.StatusCode.ABORTED)
+    self.assertEqual(test_status.code(), _ABORTED)
     self.assertEqual(test_status.message(), 'test')
 
   def test_member_method(self):
-    test_status = status_example.TestClass().make_status(status.StatusCode.OK)
-    self.assertEqual(test_status.code(), status.StatusCode.OK)
-    test_status = status_example.TestClass().make_status_const(
-        status.StatusCode.OK)
-    self.assertEqual(test_status.code(), status.StatusCode.OK)
+    test_status = self._test_obj.make_status(_OK)
+    self.assertEqual(test_status.code(), _OK)
+    test_status = self._test_obj.make_status_const(_OK)
+    self.assertEqual(test_status.code(), _OK)
 
   def test_is_ok(self):
-    ok_status = status_example.make_status(status.StatusCode.OK)
+    ok_status = _make_status(_OK)
     self.assertTrue(status.is_ok(ok_status))
-    failure_status = status_example.make_status(status.StatusCode.CANCELLED)
+    failure_status = _make_status(_CANCELLED)
     self.assertFalse(status.is_ok(failure_status))
 
   def test_ok_to_string(self):
-    ok_status = status_example.make_status(status.StatusCode.OK)
+    ok_status = _make_status(_OK)
     self.assertEqual(ok_status.to_string(), 'OK')
     self.assertEqual(repr(ok_status), 'OK')
     self.assertEqual(str(ok_status), 'OK')
@@ -107,63 +133,62 @@ class StatusTest(absltest.TestCase):
 
 class StatusOrTest(absltest.TestCase):
 
+  @classmethod
+  def setUpClass(cls):
+    super(StatusOrTest, cls).setUpClass()
+    cls._test_obj = status_example.TestClass()
+
   def test_return_value(self):
-    self.assertEqual(status_example.return_value_status_or(5), 5)
+    self.assertEqual(_return_value_status_or(5), 5)
 
   def test_return_not_ok(self):
     with self.assertRaises(status.StatusNotOk) as cm:
-      status_example.return_failure_status_or(status.StatusCode.NOT_FOUND)
-    self.assertEqual(cm.exception.status.code(), status.StatusCode.NOT_FOUND)
+      _return_failure_status_or(_NOT_FOUND)
+    self.assertEqual(cm.exception.status.code(), _NOT_FOUND)
 
   def test_make_not_ok(self):
-    self.assertEqual(
-        status_example.make_failure_status_or(
-            status.StatusCode.CANCELLED).code(), status.StatusCode.CANCELLED)
+    self.assertEqual(_make_failure_status_or(_CANCELLED).code(), _CANCELLED)
 
   def test_make_not_ok_manual_cast(self):
     self.assertEqual(
-        status_example.make_failure_status_or_manual_cast(
-            status.StatusCode.CANCELLED).code(), status.StatusCode.CANCELLED)
+        _make_failure_status_or_manual_cast(_CANCELLED).code(), _CANCELLED)
 
   def test_return_ptr_status_or(self):
-    result_1 = status_example.return_ptr_status_or(5)
+    result_1 = _return_ptr_status_or(5)
     self.assertEqual(result_1.value, 5)
-    result_2 = status_example.return_ptr_status_or(6)
+    result_2 = _return_ptr_status_or(6)
     self.assertEqual(result_2.value, 6)
     # result_1 and 2 reference the same value, so they should always be equal.
     self.assertEqual(result_1.value, result_2.value)
 
   def test_return_unique_ptr(self):
-    result = status_example.return_unique_ptr_status_or(5)
+    result = _return_unique_ptr_status_or(5)
     self.assertEqual(result.value, 5)
 
   def test_member_method(self):
-    test_status = status_example.TestClass().make_failure_status_or(
-        status.StatusCode.ABORTED)
-    self.assertEqual(test_status.code(), status.StatusCode.ABORTED)
+    test_status = self._test_obj.make_failure_status_or(_ABORTED)
+    self.assertEqual(test_status.code(), _ABORTED)
 
   def test_is_ok(self):
-    ok_result = status_example.return_value_status_or(5)
+    ok_result = _return_value_status_or(5)
     self.assertEqual(ok_result, 5)
     self.assertTrue(status.is_ok(ok_result))
-    failure_result = status_example.make_failure_status_or(
-        status.StatusCode.CANCELLED)
+    failure_result = _make_failure_status_or(_CANCELLED)
     self.assertFalse(status.is_ok(failure_result))
 
   def test_return_status_or_pointer(self):
     expected_result = 42
     for _ in range(3):
-      result = status_example.return_status_or_pointer()
+      result = _return_status_or_pointer()
       self.assertEqual(result, expected_result)
 
   def test_return_failed_status_or_pointer(self):
     for _ in range(3):
       with self.assertRaises(status.StatusNotOk):
-        status_example.return_failure_status_or_pointer()
+        _return_failure_status_or_pointer()
 
   def test_canonical_error_to_string(self):
-    failure_result = status_example.make_failure_status_or(
-        status.StatusCode.CANCELLED)
+    failure_result = _make_failure_status_or(_CANCELLED)
     self.assertEqual(failure_result.to_string(), 'CANCELLED: ')
     self.assertEqual(repr(failure_result), 'CANCELLED: ')
     self.assertEqual(str(failure_result), 'CANCELLED: ')